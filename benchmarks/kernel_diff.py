@@ -0,0 +1,150 @@
+"""
+Differential check and speed comparison of buckshot.kernel vs BuckshotEngine.
+
+Both engines play the same seeded games (buckshot.playout streams) with
+the same random policy; every turn's action, healths and chamber size
+must match, as must the final winner. Both are then timed the same way
+on replays of those games, one timed block per game over full turns,
+reloads included: engine.execute per turn against kernel.replay, the
+kernel's batched entry point. kernel.advance per turn is shown as well.
+This is also the gate on kernel.reload, which replays CPython's randint,
+shuffle and choice as raw getrandbits draws: a divergence after a Python
+upgrade points there first.
+
+    python benchmarks/kernel_diff.py --games 2000
+
+Exits with status 1 on any divergence or when kernel.replay's full-turn
+cost is not at least --min-speedup times lower than the engine's.
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+
+from buckshot import kernel, playout
+from buckshot.action import VALID_ACTIONS
+from buckshot.engine import BuckshotEngine
+
+ITEMS = tuple(VALID_ACTIONS)
+Trace = list[tuple[int, int, int, int]] # opcode, h0, h1, shells left
+
+def engine_game(engine: BuckshotEngine, seed: int, game: int, max_turns: int) -> tuple[Trace, int]:
+    s = playout.deal(engine, seed, game)
+    p0, p1 = engine.PLAYERS
+    trace: Trace = []
+    for item in playout.turns(engine, s.policy, max_turns=max_turns):
+        # the kernel clamps health at 0
+        trace.append((ITEMS.index(item), max(p0.health, 0), max(p1.health, 0), len(engine.SHOTGUN.chamber)))
+
+    winner = engine.winner
+    return trace, engine.PLAYERS.index(winner) if winner is not None else -1
+
+def kernel_game(seed: int, game: int, max_health: int, n_items: int, max_turns: int) -> tuple[Trace, int]:
+    s = playout.streams(seed, game)
+    state = kernel.reload(kernel.new_game(max_health), n_items, s.shells, s.items)
+    trace: Trace = []
+    for _ in range(max_turns):
+        opcode = kernel.random_policy(state, s.policy)
+        state = kernel.advance(state, opcode, n_items, s.shells, s.items)
+        h0, h1, _, _, _, length, _, _, _ = kernel.unpack(state)
+        trace.append((opcode, h0, h1, length))
+        if kernel.over(state):
+            break
+    return trace, kernel.winner(state)
+
+def time_engine(engine: BuckshotEngine, seed: int, games: list[list[int]]) -> float:
+    """Replay recorded games through engine.execute, reloads included"""
+    clock = time.perf_counter
+    total = 0.0
+    for game, opcodes in enumerate(games):
+        playout.deal(engine, seed, game)
+        execute, items = engine.execute, [ITEMS[op] for op in opcodes]
+        start = clock()
+        for item in items:
+            execute(item)
+        total += clock() - start
+    return total
+
+def time_kernel(seed: int, games: list[list[int]], max_health: int, n_items: int, batched: bool) -> float:
+    """
+    Same replay through the kernel, timed the same way as time_engine:
+    one kernel.replay call per game when batched, else kernel.advance per turn.
+    """
+    clock = time.perf_counter
+    advance, replay = kernel.advance, kernel.replay
+    total = 0.0
+    for game, opcodes in enumerate(games):
+        s = playout.streams(seed, game)
+        shells, items = s.shells, s.items
+        state = kernel.reload(kernel.new_game(max_health), n_items, shells, items)
+        start = clock()
+        if batched:
+            state = replay(state, opcodes, n_items, shells, items)
+        else:
+            for opcode in opcodes:
+                state = advance(state, opcode, n_items, shells, items)
+        total += clock() - start
+    return total
+
+def replayed_winner(seed: int, game: int, opcodes: list[int], max_health: int, n_items: int) -> int:
+    s = playout.streams(seed, game)
+    state = kernel.reload(kernel.new_game(max_health), n_items, s.shells, s.items)
+    return kernel.winner(kernel.replay(state, opcodes, n_items, s.shells, s.items))
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-health", type=int, default=BuckshotEngine.MAX_HEALTH)
+    parser.add_argument("--n-items", type=int, default=BuckshotEngine.N_ITEMS)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--min-speedup", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs, the fastest is kept")
+    args = parser.parse_args(argv)
+
+    engine = BuckshotEngine()
+    engine.MAX_HEALTH, engine.N_ITEMS = args.max_health, args.n_items
+
+    games: list[list[int]] = []
+    for game in range(args.games):
+        expected = engine_game(engine, args.seed, game, args.max_turns)
+        actual = kernel_game(args.seed, game, args.max_health, args.n_items, args.max_turns)
+        opcodes = [t[0] for t in expected[0]]
+        if actual == expected and replayed_winner(args.seed, game, opcodes, args.max_health, args.n_items) != expected[1]:
+            print(f"Error: game {game} ends differently through kernel.replay", file=sys.stderr)
+            return 1
+        if actual != expected:
+            turn = next(
+                (i for i, (a, b) in enumerate(zip(*(g[0] for g in (expected, actual)))) if a != b),
+                min(len(expected[0]), len(actual[0])),
+            )
+            print(f"Error: game {game} diverges at turn {turn}", file=sys.stderr)
+            return 1
+        games.append(opcodes)
+
+    n_turns = sum(len(opcodes) for opcodes in games)
+    # interleaved, so load drift on the machine hits both sides alike
+    runs = [
+        (
+            time_engine(engine, args.seed, games),
+            time_kernel(args.seed, games, args.max_health, args.n_items, False),
+            time_kernel(args.seed, games, args.max_health, args.n_items, True),
+        )
+        for _ in range(args.repeat)
+    ]
+    e_total, k_step, k_total = (min(times) for times in zip(*runs))
+    speedup = e_total / k_total
+
+    print(f"{args.games} games, {n_turns} turns: identical outcomes")
+    print(f"engine.execute: {e_total / n_turns * 1e9:.0f} ns/turn")
+    print(f"kernel.advance: {k_step / n_turns * 1e9:.0f} ns/turn ({e_total / k_step:.1f}x, one call per turn)")
+    print(f"kernel.replay:  {k_total / n_turns * 1e9:.0f} ns/turn ({speedup:.1f}x, one call per game)")
+
+    if speedup < args.min_speedup:
+        print(f"Error: kernel speedup {speedup:.1f}x below {args.min_speedup}x", file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
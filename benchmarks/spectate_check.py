@@ -0,0 +1,134 @@
+"""
+Round-trip check of buckshot.spectate against a live engine.
+
+Plays a seeded game with a SpectatorServer attached and a spectator
+connected over its unix socket, and checks the spectator always ends up
+on the board the engine last published: through the join keyframe, a
+stale client being skipped and resynced, and a board that does not fit
+the frame format being dropped (with a warning) while the game goes on.
+
+    python benchmarks/spectate_check.py --turns 200
+
+Exits with status 1 on the first board the spectator gets wrong or never
+receives.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import logging
+import os
+import random as rand
+import sys
+import tempfile
+from collections.abc import AsyncGenerator
+from typing import override
+
+from buckshot.engine import BuckshotEngine
+from buckshot.entity import Inventory
+from buckshot.spectate import DeltaEncoder, SpectatorServer, spectate
+
+class CheckFailed(Exception):
+    pass
+
+class Published(BuckshotEngine.Observer):
+    """Keeps the flattened board of the last state the engine published"""
+    def __init__(self, engine: BuckshotEngine) -> None:
+        self.fields: tuple[int, ...] = ()
+        engine.attach(self)
+
+    @override
+    def on_engine_update(self, state: BuckshotEngine.State) -> None:
+        self.fields = DeltaEncoder.flatten(state)
+
+class Warnings(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.records: list[logging.LogRecord] = []
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+async def receive(seen: AsyncGenerator[tuple[int, ...]], expected: tuple[int, ...], what: str) -> None:
+    """Read frames until the spectator shows `expected`"""
+    fields = None
+    try:
+        while fields != expected:
+            fields = await asyncio.wait_for(anext(seen), timeout=1)
+    except (TimeoutError, StopAsyncIteration):
+        raise CheckFailed(f"{what}: spectator never showed {expected}, last frame {fields}") from None
+
+async def check(seed: int, turns: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "spectate.sock")
+        engine = BuckshotEngine()
+        server = SpectatorServer(engine, path, keyframe_every=16)
+        published = Published(engine)
+        await server.start()
+
+        rand.seed(seed)
+        engine.sign("Player")
+        seen = spectate(path)
+        try:
+            # Joining mid-game starts with a keyframe of the current board
+            first = await asyncio.wait_for(anext(seen), timeout=1)
+            if first != published.fields:
+                raise CheckFailed(f"join keyframe {first}, expected {published.fields}")
+            while not server.n_clients:
+                await asyncio.sleep(0)
+
+            for turn in range(turns):
+                if engine.over:
+                    engine.reset(hard=True)
+
+                # A spectator behind on its buffer is skipped, then resynced
+                stale = turn % 7 == 3
+                high_water = server.high_water
+                if stale:
+                    server.high_water = -1
+                before = published.fields
+                engine.execute(rand.choice(["gun", *Inventory.VALID_ITEMS]))
+                server.high_water = high_water
+                if not stale and published.fields != before:
+                    await receive(seen, published.fields, f"turn {turn}")
+
+            # A board that does not fit i8 fields is dropped, the game goes on
+            warnings, log = Warnings(), logging.getLogger("buckshot.spectate")
+            log.addHandler(warnings)
+            try:
+                player = engine.PLAYERS[0]
+                health = player.health
+                player.health = 1000
+                engine.notify()
+                player.health = health % 5 + 1 # differs from the last frame sent
+                engine.notify()
+            finally:
+                log.removeHandler(warnings)
+
+            # the next frame is the board after the dropped one
+            fields = await asyncio.wait_for(anext(seen), timeout=1)
+            if fields != published.fields:
+                raise CheckFailed(f"after a dropped frame got {fields}, expected {published.fields}")
+            if len(warnings.records) != 1 or warnings.records[0].exc_info:
+                raise CheckFailed(f"expected one warning without traceback, got {warnings.records}")
+        finally:
+            await seen.aclose()
+            await server.close()
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(check(args.seed, args.turns))
+    except (CheckFailed, TimeoutError) as exc:
+        print(f"Error: {str(exc) or 'spectator timed out'}", file=sys.stderr)
+        return 1
+
+    print(f"{args.turns} turns round-tripped to the spectator")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Headless input-to-render latency benchmark for BuckshotApp.
+
+Replays a scripted command sequence through PlayerInput with Textual's
+test pilot. Latency is stamped inside the app, from the moment
+PlayerInput.Submitted is posted to the last ThrottledObserver._draw it
+causes (or the end of the command handler when nothing is redrawn), so
+the pilot's own key-press and idle-wait overhead stays out of the figures.
+
+    python benchmarks/tui_latency.py                    # compare to baseline
+    python benchmarks/tui_latency.py --update-baseline  # record a new baseline
+
+Exits with status 1 when p99 latency regresses past the stored baseline.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import random as rand
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from textual import on
+from textual.widgets import Input
+
+from buckshot import BuckshotApp
+from buckshot.engine import BuckshotEngine
+from buckshot.entity import Inventory
+from buckshot.widget import PlayerInput, ThrottledObserver
+
+BASELINE = Path(__file__).with_name("tui_latency.baseline.json")
+
+def script(rounds: int, seed: int) -> list[str]:
+    """sign once, then rounds of gun/item use with periodic reset and clear"""
+    rng = rand.Random(seed)
+    items = list(Inventory.VALID_ITEMS)
+    cmds = ["sign bench"]
+    for r in range(rounds):
+        cmds += ["use gun" if rng.random() < 0.5 else f"use {rng.choice(items)}" for _ in range(8)]
+        cmds.append("reset")
+        if r % 4 == 3:
+            cmds.append("clear")
+    return cmds
+
+class StampedApp(BuckshotApp):
+    """BuckshotApp that records when each command is submitted, handled and drawn"""
+    def __init__(self) -> None:
+        super().__init__()
+        self.submitted = self.handled = self.drawn = 0.0
+
+    # Runs before BuckshotApp.execute: subclass handlers come first in the MRO
+    @on(PlayerInput.Submitted)
+    def stamp(self, event: PlayerInput.Submitted) -> None:
+        self.submitted = event.time # message creation, same clock as time.monotonic
+        self.call_next(self._handled)
+
+    def _handled(self) -> None:
+        self.handled = time.monotonic()
+
+    def watch_draws(self) -> list[ThrottledObserver]:
+        observers = list(self.query(ThrottledObserver))
+        for widget in observers:
+            draw = widget._draw
+            def stamped(state: BuckshotEngine.State, draw=draw) -> None:
+                draw(state)
+                self.drawn = time.monotonic()
+            widget._draw = stamped
+        return observers
+
+async def replay(cmds: list[str], seed: int) -> list[float]:
+    rand.seed(seed)
+    app = StampedApp()
+    latencies: list[float] = []
+
+    async with app.run_test(headless=True) as pilot:
+        field = app.query_one("PlayerInput Input", Input)
+        observers = app.watch_draws()
+
+        for cmd in cmds:
+            field.value = cmd
+            await pilot.press("enter")
+            await pilot.pause()
+            while any(w._pending is not None for w in observers):
+                await pilot.pause(1 / ThrottledObserver.FPS)
+            latencies.append(max(app.handled, app.drawn) - app.submitted)
+
+    return latencies
+
+def percentile(samples: list[float], q: int) -> float:
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p99 regression ratio")
+    parser.add_argument("--repeat", type=int, default=3, help="runs, the one with median p99 is kept")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    cmds = script(args.rounds, args.seed)
+    runs = sorted(
+        (asyncio.run(replay(cmds, args.seed)) for _ in range(args.repeat)),
+        key=lambda latencies: percentile(latencies, 99),
+    )
+    latencies = runs[len(runs) // 2]
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 # KiB on Linux
+
+    report = {
+        "commands": len(latencies),
+        "p50_ms": percentile(latencies, 50) * 1e3,
+        "p90_ms": percentile(latencies, 90) * 1e3,
+        "p99_ms": percentile(latencies, 99) * 1e3,
+        "max_ms": max(latencies) * 1e3,
+        "peak_rss_mib": peak / 2**20,
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.update_baseline:
+        BASELINE.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE}")
+        return 0
+
+    if not BASELINE.exists():
+        print("No baseline stored, run with --update-baseline first.", file=sys.stderr)
+        return 0
+
+    limit = json.loads(BASELINE.read_text())["p99_ms"] * (1 + args.tolerance)
+    if report["p99_ms"] > limit:
+        print(f"Error: p99 {report['p99_ms']:.2f}ms exceeds baseline limit {limit:.2f}ms", file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
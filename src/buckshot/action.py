@@ -15,14 +15,26 @@ class ActionResult:
     game_over: bool = False
 
 class Action(ABC):
-    ACTOR: Player
-    TARGET: Player
-    SHOTGUN: Shotgun
+    """
+    Actions are bound once per engine and reused on every turn;
+    ACTOR/TARGET/SHOTGUN are read from the engine at execution time.
+    """
+    RESULT: ActionResult = ActionResult()
 
     def __init__(self, engine: BuckshotEngine):
-        self.ACTOR = engine.ACTOR
-        self.TARGET = engine.TARGET
-        self.SHOTGUN = engine.SHOTGUN
+        self.engine = engine
+
+    @property
+    def ACTOR(self) -> Player:
+        return self.engine.ACTOR
+
+    @property
+    def TARGET(self) -> Player:
+        return self.engine.TARGET
+
+    @property
+    def SHOTGUN(self) -> Shotgun:
+        return self.engine.SHOTGUN
 
     @abstractmethod
     def execute(self) -> ActionResult:
@@ -31,45 +43,57 @@ class Action(ABC):
 # Failed cases: 
 # - Empty chamber (should never happen)
 class UseGunAction(Action):
+    RESULT = ActionResult(response="Use Gun")
+    SKIP_RESULT = ActionResult(response="Use Gun", skip_turn=True)
+    KILL_RESULT = ActionResult(response="Use Gun", game_over=True)
+
     @override
     def execute(self):
-        shell = self.SHOTGUN.eject()
-        skip_turn = False
+        shotgun = self.SHOTGUN
+        target = self.TARGET
+        shell = shotgun.eject()
+        result = self.RESULT
 
         if shell is None:
             pass
 
         if shell is True:
-            self.TARGET.health -= self.SHOTGUN.damage
+            target.health -= shotgun.damage
+            if target.health <= 0:
+                result = self.KILL_RESULT
 
-        if shell is False and self.TARGET is self.ACTOR:
-            skip_turn = True
+        if shell is False and target is self.ACTOR:
+            result = self.SKIP_RESULT
 
-        self.SHOTGUN.damage = 1
-        return ActionResult(response="Use Gun", skip_turn=skip_turn)
+        shotgun.damage = 1
+        return result
 
 # Failed cases: 
 # - Empty chamber (should never happen)
 # - Does not have item
 class UseMagnifierAction(Action):
+    RESULT = ActionResult(response="Use Magnifier")
+
     @override
     def execute(self):
-        return ActionResult(response="Use Magnifier")
+        return self.RESULT
 
 # Failed cases: 
 # - Empty chamber (should never happen)
 # - Does not have item
 class UseBeerAction(Action):
+    RESULT = ActionResult(response="Use Beer")
+
     @override
     def execute(self):
-        return ActionResult(response="Use Beer")
+        return self.RESULT
 
 # Failed cases: 
 # - Does not have item
 class UseHandsawAction(Action):
     @override
     def execute(self):
-        return ActionResult()
+        return self.RESULT
 
 # Failed cases: 
 # - Does not have item
@@ -77,7 +101,7 @@ class UseHandsawAction(Action):
 class UseCigaretteAction(Action):
     @override
     def execute(self):
-        return ActionResult()
+        return self.RESULT
 
 # Failed cases:
 # - Does not have item
@@ -85,7 +109,7 @@ class UseCigaretteAction(Action):
 class UseHandcuffAction(Action):
     @override
     def execute(self):
-        return ActionResult()
+        return self.RESULT
 
 VALID_ACTIONS: dict[str, type[Action]] = {
     "magnifier": UseMagnifierAction,
@@ -95,3 +119,9 @@ VALID_ACTIONS: dict[str, type[Action]] = {
     "handcuff": UseHandcuffAction,
     "gun": UseGunAction
 }
+
+# Integer opcodes follow VALID_ACTIONS order, so engines can keep a
+# tuple of pre-bound actions and dispatch by index.
+OPCODES: dict[str, int] = {item: op for op, item in enumerate(VALID_ACTIONS)}
+NO_OPCODE: int = -1
+INVALID_OPCODE: int = -2
@@ -5,9 +5,10 @@ from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import ScrollableContainer
 from textual.suggester import SuggestFromList
+from textual.widgets import Input
 
+from buckshot.dealer import SpeculativeDealer
 from buckshot.engine import BuckshotEngine
-from buckshot.action import Command
 from buckshot.widget import *
 
 # ---Main App---
@@ -15,6 +16,7 @@ class BuckshotApp(App):
     ENABLE_COMMAND_PALETTE = False
     TITLE = "BUCKSHOTxROULETTE"
     ENGINE: BuckshotEngine
+    DEALER: SpeculativeDealer
     AUTO_FOCUS = "PlayerInput Input"
 
     DEFAULT_CSS = """
@@ -36,6 +38,7 @@ class BuckshotApp(App):
         super().__init__()
         self.sub_title = self.version
         self.ENGINE = BuckshotEngine()
+        self.DEALER = SpeculativeDealer()
 
     @property
     def version(self):
@@ -45,32 +48,32 @@ class BuckshotApp(App):
             return "Unknown"
 
     @property
-    def commands(self) -> dict[str, Command]:
+    def commands(self) -> dict[str, BuckshotEngine.Command]:
         return {
-            "clear": Command(
+            "clear": BuckshotEngine.Command(
                 handler=self.query_one(Logs).clear,
                 description="Clear game logs"
             ),
-            "exit": Command(
+            "exit": BuckshotEngine.Command(
                 handler=self.app.exit,
                 description="Exit the game"
             ),
-            "help": Command(
+            "help": BuckshotEngine.Command(
                 handler=self.help,
                 description="Show available commands"
             ),
-            "reset": Command(
+            "reset": BuckshotEngine.Command(
                 handler=lambda: self.ENGINE.reset(hard=True),
                 turn_req=True,
                 description="Reset the current game"
             ),
-            "use": Command(
-                handler=self.ENGINE.execute,
+            "use": BuckshotEngine.Command(
+                handler=self.use,
                 turn_req=True,
                 n_args=1,
                 description="Use an item"
             ),
-            "sign": Command(
+            "sign": BuckshotEngine.Command(
                 handler=self.ENGINE.sign,
                 once=True,
                 n_args=1,
@@ -99,9 +102,25 @@ class BuckshotApp(App):
     def help(self) -> None:
         pass
 
+    def use(self, item: str) -> None:
+        """Play the player's item, then let the Dealer reply until the turn comes back"""
+        engine = self.ENGINE
+        engine.execute(item)
+        while engine.ready and not engine.over and not self.is_player_turn:
+            engine.execute(self.DEALER.reply(engine))
+
+    def on_unmount(self) -> None:
+        self.DEALER.shutdown()
+
     def key_enter(self):
         self.query_one("PlayerInput Input").focus()
 
+    @on(Input.Changed)
+    def speculate(self, event: Input.Changed) -> None:
+        """Search the Dealer's replies in the background while the player types"""
+        if self.is_player_turn and not self.ENGINE.over:
+            self.DEALER.speculate(self.ENGINE)
+
     @on(PlayerInput.Submitted)
     def execute(self, event: PlayerInput.Submitted) -> None:
         """
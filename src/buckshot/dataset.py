@@ -0,0 +1,250 @@
+"""
+Columnar dataset export for balance analysis.
+
+Simulated games are streamed into per-column `.npy` shards:
+    <root>/manifest.json
+    <root>/<table>/<column>.<shard>.npy
+so aggregations can memory-map one column at a time without ever
+building Python objects per game or per turn.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from buckshot.action import OPCODES, VALID_ACTIONS
+from buckshot.engine import BuckshotEngine
+from buckshot import playout
+from buckshot.playout import Policy, random_policy
+
+MANIFEST = "manifest.json"
+VERSION = 2
+
+SCHEMAS: dict[str, dict[str, str]] = {
+    "games": {
+        "game": "<i8",
+        "seed": "<i8", # run seed, game i replays on playout.streams(seed, i)
+        "stage": "u1",
+        "max_health": "u1",
+        "n_items": "u1",
+        "n_turns": "<u4",
+        "n_reloads": "<u2",
+        "winner": "i1", # seat index, -1 if unfinished
+        "damage_0": "<u2",
+        "damage_1": "<u2",
+        **{f"uses_{item}": "<u2" for item in VALID_ACTIONS},
+    },
+    "turns": {
+        "game": "<i8",
+        "turn": "<u4",
+        "actor": "u1",
+        "opcode": "u1",
+        "shell": "i1", # 1 live, 0 blank, -1 no shot fired
+        "damage": "u1",
+    },
+    "reloads": {
+        "game": "<i8",
+        "turn": "<u4",
+        "capacity": "u1",
+        "lives": "u1",
+    },
+}
+
+class ShardWriter:
+    """Buffer rows of one table in fixed-size column arrays, spill full chunks to disk."""
+    def __init__(self, root: Path, table: str, chunk_rows: int) -> None:
+        self.path = root / table
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.schema = SCHEMAS[table]
+        self.columns = [np.empty(chunk_rows, dtype=d) for d in self.schema.values()]
+        self.chunk_rows = chunk_rows
+        self.shards: list[int] = []
+        self.n = 0
+
+    def append(self, *row: int) -> None:
+        n = self.n
+        for column, value in zip(self.columns, row):
+            column[n] = value
+
+        self.n = n + 1
+        if self.n == self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.n:
+            return
+
+        shard = len(self.shards)
+        for name, column in zip(self.schema, self.columns):
+            np.save(self.path / f"{name}.{shard:05d}.npy", column[:self.n])
+        self.shards.append(self.n)
+        self.n = 0
+
+class DatasetWriter:
+    def __init__(self, root: str | Path, chunk_rows: int = 1 << 20) -> None:
+        self.root = Path(root)
+        self.chunk_rows = chunk_rows
+        self.tables = {t: ShardWriter(self.root, t, chunk_rows) for t in SCHEMAS}
+
+    def close(self) -> None:
+        """Flush pending rows and write the schema manifest"""
+        for writer in self.tables.values():
+            writer.flush()
+
+        manifest = {
+            "version": VERSION,
+            "chunk_rows": self.chunk_rows,
+            "tables": {
+                name: {"schema": writer.schema, "shards": writer.shards}
+                for name, writer in self.tables.items()
+            },
+        }
+        (self.root / MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    def __enter__(self) -> DatasetWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+def simulate(
+    out: DatasetWriter,
+    n_games: int,
+    seed: int = 0,
+    stage: int = BuckshotEngine.STAGE,
+    max_health: int = BuckshotEngine.MAX_HEALTH,
+    n_items: int = BuckshotEngine.N_ITEMS,
+    policy: Policy = random_policy,
+    max_turns: int = 1000,
+) -> None:
+    """
+    Play `n_games` with `policy` on both seats and stream the records.
+    Game i runs on the playout streams of (seed, i), so it can be replayed.
+    """
+    games, turns, reloads = (out.tables[t].append for t in ("games", "turns", "reloads"))
+    gun = OPCODES["gun"]
+
+    engine = BuckshotEngine()
+    engine.STAGE, engine.MAX_HEALTH, engine.N_ITEMS = stage, max_health, n_items
+
+    for game in range(n_games):
+        rng = playout.deal(engine, seed, game).policy
+        shotgun = engine.SHOTGUN
+        players = engine.PLAYERS
+        damage = [0] * len(players)
+        uses = [0] * len(VALID_ACTIONS)
+        n_reloads = 1
+        reloads(game, 0, len(shotgun.chamber), shotgun.chamber.count(True))
+
+        # the board each item is played on is the one the previous turn left
+        turn = 0
+        actor, target = engine.TURN, players.index(engine.TARGET)
+        loaded, health = len(shotgun.chamber), engine.TARGET.health
+        for item in playout.turns(engine, rng, policy, max_turns):
+            opcode = OPCODES[item]
+            dealt = health - players[target].health
+            damage[actor] += dealt
+            uses[opcode] += 1
+            turns(game, turn, actor, opcode, (dealt > 0) if opcode == gun else -1, dealt)
+
+            turn += 1
+            if opcode == gun and loaded == 1 and not engine.over:
+                n_reloads += 1
+                reloads(game, turn, len(shotgun.chamber), shotgun.chamber.count(True))
+
+            actor, target = engine.TURN, players.index(engine.TARGET)
+            loaded, health = len(shotgun.chamber), engine.TARGET.health
+
+        winner = engine.winner
+        games(
+            game, seed, stage, max_health, n_items, turn, n_reloads,
+            players.index(winner) if winner is not None else -1,
+            *damage, *uses,
+        )
+
+# --- Out-of-core reading ---
+def load_manifest(root: str | Path) -> dict:
+    return json.loads((Path(root) / MANIFEST).read_text())
+
+def iter_shards(
+    root: str | Path,
+    table: str,
+    columns: list[str] | None = None,
+) -> Iterator[dict[str, np.ndarray]]:
+    """Yield each shard of `table` as memory-mapped column arrays"""
+    root = Path(root)
+    info = load_manifest(root)["tables"][table]
+    names = columns or list(info["schema"])
+    for shard in range(len(info["shards"])):
+        yield {
+            name: np.load(root / table / f"{name}.{shard:05d}.npy", mmap_mode="r")
+            for name in names
+        }
+
+def aggregate(root: str | Path) -> dict:
+    """Streaming summary of a dataset, one shard in memory at a time"""
+    n_games = n_turns = 0
+    wins = np.zeros(2, dtype=np.int64)
+    damage = np.zeros(2, dtype=np.int64)
+    uses = {item: 0 for item in VALID_ACTIONS}
+    for shard in iter_shards(root, "games"):
+        n_games += len(shard["game"])
+        n_turns += int(shard["n_turns"].sum(dtype=np.int64))
+        wins += np.bincount(shard["winner"][shard["winner"] >= 0], minlength=2)[:2]
+        damage += [int(shard["damage_0"].sum(dtype=np.int64)), int(shard["damage_1"].sum(dtype=np.int64))]
+        for item in uses:
+            uses[item] += int(shard[f"uses_{item}"].sum(dtype=np.int64))
+
+    shots = lives = 0
+    for shard in iter_shards(root, "turns", ["shell"]):
+        shell = shard["shell"]
+        shots += int(np.count_nonzero(shell >= 0))
+        lives += int(np.count_nonzero(shell == 1))
+
+    capacity = np.zeros(256, dtype=np.int64)
+    for shard in iter_shards(root, "reloads", ["capacity"]):
+        capacity += np.bincount(shard["capacity"], minlength=256)
+
+    return {
+        "games": n_games,
+        "turns": n_turns,
+        "mean_turns": n_turns / n_games if n_games else 0.0,
+        "win_rate": (wins / n_games).tolist() if n_games else [0.0, 0.0],
+        "mean_damage": (damage / n_games).tolist() if n_games else [0.0, 0.0],
+        "live_shot_rate": lives / shots if shots else 0.0,
+        "action_uses": uses,
+        "reload_capacity": {c: int(n) for c, n in enumerate(capacity) if n},
+    }
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m buckshot.dataset")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    export = sub.add_parser("export", help="Simulate games into a columnar dataset")
+    export.add_argument("root")
+    export.add_argument("--games", type=int, default=10_000)
+    export.add_argument("--seed", type=int, default=0)
+    export.add_argument("--stage", type=int, default=BuckshotEngine.STAGE)
+    export.add_argument("--max-health", type=int, default=BuckshotEngine.MAX_HEALTH)
+    export.add_argument("--n-items", type=int, default=BuckshotEngine.N_ITEMS)
+    export.add_argument("--chunk-rows", type=int, default=1 << 20)
+
+    summary = sub.add_parser("aggregate", help="Summarize a dataset out-of-core")
+    summary.add_argument("root")
+
+    args = parser.parse_args(argv)
+    if args.cmd == "export":
+        with DatasetWriter(args.root, args.chunk_rows) as out:
+            simulate(
+                out, args.games, args.seed,
+                stage=args.stage, max_health=args.max_health, n_items=args.n_items,
+            )
+    else:
+        print(json.dumps(aggregate(args.root), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Dealer agent with speculative replies.
+
+The Dealer searches the packed kernel state (see `buckshot.kernel`) but
+only looks at shell counts, never at their order. While the player is
+still typing, SpeculativeDealer steps the current position through each
+action the player can take and searches the Dealer's reply to every
+resulting position in the background, keyed by the packed state. Once the
+player submits, the reply for the position actually reached is picked up
+if its search has finished, and every other search is cancelled.
+
+The default executor is a single worker thread. The search is pure Python
+and holds the GIL, so it competes with the UI thread for the interpreter
+while it runs; that is accepted because each search is short, the
+`_value` cache it fills is shared with on-demand replies, and the UI is
+idle most of the time the player is typing. Pass a ProcessPoolExecutor
+to move the search off the interpreter entirely, at the cost of worker
+start-up, pickling each call and a search cache per process.
+"""
+from __future__ import annotations
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import lru_cache
+
+from buckshot import kernel
+from buckshot.action import VALID_ACTIONS
+from buckshot.engine import BuckshotEngine
+
+ITEMS: tuple[str, ...] = tuple(VALID_ACTIONS)
+SEAT: int = 1 # Dealer always sits opposite the player in 1v1
+DEPTH: int = 14
+
+@lru_cache(maxsize=1 << 18)
+def _value(
+    h0: int, h1: int,
+    lives: int, blanks: int,
+    damage: int, turn: int,
+    pass0: bool, pass1: bool,
+    depth: int,
+) -> float:
+    """
+    Expectimax win chance of the Dealer: the Dealer maximises, the player
+    minimises, shells are drawn at random from the remaining counts.
+    Items have no effect yet, so using one is a pass.
+    """
+    if h0 <= 0:
+        return 1.0
+    if h1 <= 0:
+        return 0.0
+    if not depth or not lives + blanks:
+        return h1 / (h0 + h1)
+
+    shot = 0.0
+    if lives:
+        hit = (h0 - damage, h1) if turn == SEAT else (h0, h1 - damage)
+        shot += lives / (lives + blanks) * _value(*hit, lives - 1, blanks, 1, turn ^ 1, pass0, pass1, depth - 1)
+    if blanks:
+        shot += blanks / (lives + blanks) * _value(h0, h1, lives, blanks - 1, 1, turn ^ 1, pass0, pass1, depth - 1)
+
+    if not (pass1 if turn == SEAT else pass0):
+        return shot
+
+    skip = _value(h0, h1, lives, blanks, damage, turn ^ 1, pass0, pass1, depth - 1)
+    return max(shot, skip) if turn == SEAT else min(shot, skip)
+
+def best_reply(state: int, depth: int = DEPTH) -> int:
+    """Opcode the Dealer should play from a packed state where it holds the turn"""
+    h0, h1, inv0, inv1, chamber, length, damage, _, _ = kernel.unpack(state)
+    lives = (chamber & ((1 << length) - 1)).bit_count()
+    blanks = length - lives
+    held = [op for slot, op in enumerate(kernel.ITEM_OPCODES) if kernel.item_count(inv1, slot)]
+
+    if not held:
+        return kernel.GUN
+
+    pass0 = bool(inv0)
+    shot = 0.0
+    if lives:
+        shot += lives / length * _value(h0 - damage, h1, lives - 1, blanks, 1, 0, pass0, True, depth - 1)
+    if blanks:
+        shot += blanks / length * _value(h0, h1, lives, blanks - 1, 1, 0, pass0, True, depth - 1)
+    skip = _value(h0, h1, lives, blanks, damage, 0, pass0, True, depth - 1)
+
+    return kernel.GUN if shot >= skip else held[0]
+
+class SpeculativeDealer:
+    def __init__(self, depth: int = DEPTH, executor: Executor | None = None) -> None:
+        self.depth = depth
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="dealer")
+        self._root: int | None = None
+        self._replies: dict[int, Future[int]] = {}
+
+    @staticmethod
+    def likely_positions(state: int) -> set[int]:
+        """
+        Positions the Dealer can face after the player's next action. Actions
+        that empty the chamber are left out, the reload that follows is random.
+        """
+        inv = state >> kernel.INV0 & kernel.INV_MASK
+        opcodes = [op for slot, op in enumerate(kernel.ITEM_OPCODES) if kernel.item_count(inv, slot)]
+        opcodes.append(kernel.GUN)
+
+        positions: set[int] = set()
+        for opcode in opcodes:
+            after = kernel.step(state, opcode)
+            if not kernel.over(after) and not kernel.empty(after):
+                positions.add(after)
+        return positions
+
+    def speculate(self, engine: BuckshotEngine) -> None:
+        """Start searching replies for the player's position, once per position"""
+        try:
+            state = kernel.from_engine(engine)
+        except ValueError:
+            return # board does not fit the kernel layout, nothing to speculate on
+
+        if state == self._root:
+            return
+
+        self.cancel()
+        self._root = state
+        for position in self.likely_positions(state):
+            self._replies[position] = self._executor.submit(best_reply, position, self.depth)
+
+    def reply(self, engine: BuckshotEngine) -> str:
+        """
+        Item the Dealer uses now. A finished speculated search is used as is;
+        one still queued or running is never waited on, the reply is
+        searched on the spot instead.
+        """
+        try:
+            state = kernel.from_engine(engine)
+        except ValueError:
+            self.cancel()
+            return ITEMS[kernel.GUN] # board does not fit the kernel layout
+
+        future = self._replies.pop(state, None)
+        self.cancel()
+
+        if future is not None and future.done() and not future.cancelled() and future.exception() is None:
+            return ITEMS[future.result()]
+        return ITEMS[best_reply(state, self.depth)]
+
+    def cancel(self) -> None:
+        for future in self._replies.values():
+            future.cancel()
+        self._replies.clear()
+        self._root = None
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
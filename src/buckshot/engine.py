@@ -1,13 +1,16 @@
 from __future__ import annotations
+import random as rand
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Callable, TYPE_CHECKING, Literal
 
-from buckshot.entity import Dealer
+from buckshot.action import OPCODES, NO_OPCODE, INVALID_OPCODE, VALID_ACTIONS
+from buckshot.entity import RNG, Dealer, Inventory, Player, Shotgun
+from buckshot.state import AWAIT_ACTION, GAME_OVER_STATE, INIT, RESOLVE, STAY, TRANSITIONS
 
 if TYPE_CHECKING:
-    from buckshot.state import FSM, InitState
-    from buckshot.entity import Player, Shotgun
+    from buckshot.action import Action
+    from buckshot.state import FSM
 
 class BuckshotEngine:
     @dataclass(frozen=True)
@@ -29,11 +32,6 @@ class BuckshotEngine:
         once: bool = False
         description: str = ""
 
-    @dataclass(frozen=True)
-    class Trigger:
-        item: str
-        target_id: int | None = None
-
     class Observer:
         @abstractmethod
         def on_engine_update(
@@ -48,6 +46,11 @@ class BuckshotEngine:
     TURN: int = 0
     MAX_HEALTH: int = 3 # I: 3, II: 4, III: 5
     N_ITEMS: int = 2 # I: 2, II: 4, III: 4
+    # Rule and randomness config, read whenever a shotgun or inventory is made
+    ITEM_CAPS: dict[str, int] = Inventory.VALID_ITEMS
+    CAPACITY: tuple[int, int] = (Shotgun.MIN_CAPACITY, Shotgun.MAX_CAPACITY)
+    SHELL_RNG: RNG = rand
+    ITEM_RNG: RNG = rand
 
     PLAYERS : tuple[Player, ...]
     ACTOR: Player
@@ -56,30 +59,68 @@ class BuckshotEngine:
 
     def __init__(self) -> None:
         self._observers: list[BuckshotEngine.Observer] = []
-        self._state: FSM = InitState()
+        self._state: FSM = INIT
+        self.actions: tuple[Action, ...] = tuple(a(self) for a in VALID_ACTIONS.values())
+        self.action: Action = self.actions[OPCODES["gun"]]
 
     @property
     def ready(self):
         return hasattr(self, "PLAYERS")
 
+    @property
+    def over(self) -> bool:
+        return self._state is GAME_OVER_STATE
+
+    @property
+    def winner(self) -> Player | None:
+        """Last player standing, None while the game is still running"""
+        alive = [p for p in self.PLAYERS if p.health > 0]
+        return alive[0] if len(alive) == 1 else None
+
+    def snapshot(self, response: str = "") -> State:
+        """Freeze the current board into a State for observers"""
+        return self.State(
+            response=response,
+            stage=str(self.STAGE),
+            turn=self.TURN,
+            n_items=self.N_ITEMS,
+            players=tuple(p.state for p in self.PLAYERS),
+            shotgun=self.SHOTGUN.state,
+            winner=self.winner,
+        )
+
     """Observer + Mediator = Transmitter"""
     def attach(self, observer: Observer) -> None:
         self._observers.append(observer)
 
     def notify(self, response: str = "", type: MessageType = "") -> None:
+        if not self._observers or not self.ready:
+            return
+
+        state = self.snapshot(response)
         for observer in self._observers:
-            pass
+            observer.on_engine_update(state)
 
     """Business Logic Goes Here"""
+    def new_shotgun(self) -> Shotgun:
+        return Shotgun(self.CAPACITY, self.SHELL_RNG)
+
+    def new_inventory(self) -> Inventory:
+        return Inventory(self.ITEM_CAPS, self.ITEM_RNG)
+
     def reset(self, hard: bool = False):
         if hard:
             self.TURN = 0
+            self.SHOTGUN = self.new_shotgun()
             for p in self.PLAYERS:
-                p.reset(self.MAX_HEALTH)
+                p.reset(self.MAX_HEALTH, self.new_inventory())
+            self._seat()
+            self._state = AWAIT_ACTION
 
         self.SHOTGUN.reload()
         for p in self.PLAYERS:
             p.inventory.add(self.N_ITEMS)
+        self.notify("Shotgun reloaded", type="info")
 
     def assign(self, name: str):
         """
@@ -87,31 +128,44 @@ class BuckshotEngine:
         Hardcode for 1v1 PVE mode only
         """
         self.PLAYERS = (
-            Player(name, self.MAX_HEALTH),
-            Dealer(self.MAX_HEALTH)
+            Player(name, self.MAX_HEALTH, self.new_inventory()),
+            Dealer(self.MAX_HEALTH, self.new_inventory())
         )
+        self._seat()
+
+    def sign(self, name: str):
+        """Assign the player and start the game"""
+        self.assign(name)
+        self.execute()
+
+    def _seat(self):
+        """Point ACTOR/TARGET at the player holding TURN and its opponent"""
+        self.ACTOR = self.PLAYERS[self.TURN]
+        self.TARGET = self.PLAYERS[(self.TURN + 1) % len(self.PLAYERS)]
 
     def next_player(self):
         """Process to next player turn"""
-        pass
+        self.TURN = (self.TURN + 1) % len(self.PLAYERS)
+        self._seat()
 
     def next_stage(self):
         """Process to next stage"""
         pass
 
     def execute(self, *args: str) -> None:
-        """Self state advance with While loop"""
-        while True:
-            new_state = self._state.update(
-                engine=self,
-                trigger=self.Trigger(args[0]) 
-                if args else None
-            )
-
-            if new_state is self._state:
-                break
-
-            self._state.on_exit(self)
-            self._state = new_state
-            self._state.on_enter(self)
+        """
+        Self state advance through the precompiled transition table;
+        the item trigger is consumed once an action has been picked.
+        """
+        opcode = OPCODES.get(args[0], INVALID_OPCODE) if args else NO_OPCODE
+        state = self._state
+
+        while (event := state.update(self, opcode)) != STAY:
+            if event == RESOLVE:
+                opcode = NO_OPCODE
+
+            state.on_exit(self)
+            state = TRANSITIONS[state][event]
+            state.on_enter(self)
+            self._state = state
 
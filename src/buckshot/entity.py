@@ -1,8 +1,22 @@
 from dataclasses import dataclass
 from collections import deque
+from collections.abc import MutableSequence, Sequence
+from typing import Any, Protocol, TypeVar
 import random as rand
 
+T = TypeVar("T")
+
+class RNG(Protocol):
+    """The part of `random` the entities draw from; the module itself or a random.Random"""
+    def randint(self, a: int, b: int) -> int: ...
+    def choice(self, seq: Sequence[T]) -> T: ...
+    def shuffle(self, x: MutableSequence[Any]) -> None: ...
+    def getrandbits(self, k: int, /) -> int: ...
+
 class Shotgun:
+    MIN_CAPACITY: int = 3
+    MAX_CAPACITY: int = 8
+
     @dataclass
     class ShotgunState:
         damage: int
@@ -10,7 +24,13 @@ class Shotgun:
         lives: int
         blanks: int
 
-    def __init__(self):
+    def __init__(
+        self,
+        capacity: tuple[int, int] = (MIN_CAPACITY, MAX_CAPACITY),
+        rng: RNG = rand,
+    ):
+        self.capacity: tuple[int, int] = capacity # reload range, both ends included
+        self.rng: RNG = rng
         self.damage: int = 1
         self.chamber: deque[bool] = deque()
 
@@ -41,14 +61,14 @@ class Shotgun:
 
     def reload(self):
         """Reload new bullets"""
-        capacity = rand.randint(3, 8)
-        lives = rand.randint(1, capacity // 2)
+        capacity = self.rng.randint(*self.capacity)
+        lives = self.rng.randint(1, capacity // 2)
         blanks = capacity - lives
 
         self.chamber.clear() # clear chamber before reload
         for bullet in [True] * lives + [False] * blanks:
             self.chamber.append(bullet)
-        rand.shuffle(self.chamber)
+        self.rng.shuffle(self.chamber)
 
     def cutoff(self):
         """Double damage dealt"""
@@ -64,7 +84,9 @@ class Inventory:
         "handcuff": 1
     }
 
-    def __init__(self) -> None:
+    def __init__(self, caps: dict[str, int] = VALID_ITEMS, rng: RNG = rand) -> None:
+        self.caps: dict[str, int] = caps # item -> most copies held, 0 to never deal it
+        self.rng: RNG = rng
         self.items: dict[str, int] = {
             "magnifier": 0,
             "beer": 0,
@@ -89,14 +111,14 @@ class Inventory:
         
         while items_added < n_items and not self.is_full:
             available = [
-                item for item, cap in self.VALID_ITEMS.items()
+                item for item, cap in self.caps.items()
                 if self.items.get(item, 0) < cap
             ]
             
             if not available:
                 break
             
-            item = rand.choice(available)
+            item = self.rng.choice(available)
             self.items[item] = self.items.get(item, 0) + 1
             
             added_items[item] = added_items.get(item, 0) + 1
@@ -117,10 +139,10 @@ class Player:
         health: int
         inventory: dict[str, int]
 
-    def __init__(self, name: str, health: int):
+    def __init__(self, name: str, health: int, inventory: Inventory | None = None):
         self.name: str = name
         self.health: int = health
-        self.inventory: Inventory = Inventory() # mutable objects however are persisted on every instance calls
+        self.inventory: Inventory = inventory if inventory is not None else Inventory() # mutable objects however are persisted on every instance calls
 
     def __hash__(self) -> int:
         """Hash comparison for Set of unique player"""
@@ -134,11 +156,11 @@ class Player:
             inventory = self.inventory.items
         )
 
-    def reset(self, health: int):
+    def reset(self, health: int, inventory: Inventory | None = None):
         self.health = health
-        self.inventory = Inventory()
+        self.inventory = inventory if inventory is not None else Inventory()
         self.turn = True
 
 class Dealer(Player):
-    def __init__(self, health: int):
-        super().__init__("Dealer", health)
+    def __init__(self, health: int, inventory: Inventory | None = None):
+        super().__init__("Dealer", health, inventory)
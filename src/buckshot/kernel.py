@@ -0,0 +1,398 @@
+"""
+Flat integer-state game kernel for bulk simulation.
+
+A whole 1v1 game is packed into one int (59 bits) and the rules of
+`action.py`/`state.py` are pure functions over it. The low BOARD_BITS
+hold everything a shot can touch, so shots are memoized per board value
+and a turn is a couple of integer ops plus one dict lookup. Random draws are made
+in the same order and from the same getrandbits bits as `Shotgun.reload`
+and `Inventory.add` (see `reload`), so a kernel game on the streams of
+`playout.streams` replays the BuckshotEngine game on those streams turn
+for turn. Only the
+default item caps and shotgun capacity are modelled.
+
+Bit fields, low to high (offsets are the constants below):
+- H0, H1: player healths, clamped at 0
+- CHAMBER, LENGTH: shell bitmask (bit i live) and shell count; eject pops bit LENGTH-1
+- DAMAGE: shotgun damage multiplier
+- TURN: seat to act
+- CUFFED: handcuff flag
+- INV0, INV1: item counts, ITEM_BITS per item in Inventory.VALID_ITEMS order
+"""
+from __future__ import annotations
+import random as rand
+from collections.abc import Callable, Iterable
+
+from buckshot.action import OPCODES
+from buckshot.engine import BuckshotEngine
+from buckshot.entity import RNG, Inventory, Shotgun
+from buckshot.playout import streams
+
+ITEM_BITS: int = 3
+HEALTH_BITS: int = 4
+INV_BITS: int = ITEM_BITS * len(Inventory.VALID_ITEMS)
+CHAMBER_BITS: int = 12
+LENGTH_BITS: int = 4
+DAMAGE_BITS: int = 3
+
+H0: int = 0
+H1: int = H0 + HEALTH_BITS
+CHAMBER: int = H1 + HEALTH_BITS
+LENGTH: int = CHAMBER + CHAMBER_BITS
+DAMAGE: int = LENGTH + LENGTH_BITS
+TURN: int = DAMAGE + DAMAGE_BITS
+CUFFED: int = TURN + 1
+BOARD_BITS: int = CUFFED + 1
+INV0: int = BOARD_BITS
+INV1: int = INV0 + INV_BITS
+
+ITEM_MASK: int = (1 << ITEM_BITS) - 1
+HEALTH_MASK: int = (1 << HEALTH_BITS) - 1
+INV_MASK: int = (1 << INV_BITS) - 1
+CHAMBER_MASK: int = (1 << CHAMBER_BITS) - 1
+LENGTH_MASK: int = (1 << LENGTH_BITS) - 1
+DAMAGE_MASK: int = (1 << DAMAGE_BITS) - 1
+
+# Whole-field masks for single-op tests and updates on a packed state
+H0_FIELD: int = HEALTH_MASK << H0
+H1_FIELD: int = HEALTH_MASK << H1
+LENGTH_FIELD: int = LENGTH_MASK << LENGTH
+DAMAGE_FIELD: int = DAMAGE_MASK << DAMAGE
+TURN_FLAG: int = 1 << TURN
+BOARD_MASK: int = (1 << BOARD_BITS) - 1
+
+CAPS: tuple[int, ...] = tuple(Inventory.VALID_ITEMS.values())
+ITEM_OPCODES: tuple[int, ...] = tuple(OPCODES[item] for item in Inventory.VALID_ITEMS)
+GUN: int = OPCODES["gun"]
+
+Policy = Callable[[int, rand.Random], int]
+
+def _available(inv: int) -> tuple[int, ...]:
+    return tuple(
+        slot for slot, cap in enumerate(CAPS)
+        if inv >> (slot * ITEM_BITS) & ITEM_MASK < cap
+    )
+
+# AVAILABLE[inv] -> item slots still under their cap, TOTAL[inv] -> item count
+AVAILABLE: dict[int, tuple[int, ...]] = {}
+TOTAL: dict[int, int] = {}
+
+def _tabulate(inv: int = 0, slot: int = 0) -> None:
+    if slot == len(CAPS):
+        AVAILABLE[inv] = _available(inv)
+        TOTAL[inv] = sum(inv >> (s * ITEM_BITS) & ITEM_MASK for s in range(len(CAPS)))
+        return
+    for n in range(CAPS[slot] + 1):
+        _tabulate(inv | n << (slot * ITEM_BITS), slot + 1)
+
+_tabulate()
+
+def pack(
+    h0: int, h1: int,
+    inv0: int = 0, inv1: int = 0,
+    chamber: int = 0, length: int = 0,
+    damage: int = 1, turn: int = 0, cuffed: int = 0,
+) -> int:
+    if max(h0, h1) > HEALTH_MASK or length > CHAMBER_BITS:
+        raise ValueError("Health or chamber size does not fit the kernel layout")
+
+    return (
+        max(h0, 0) << H0 | max(h1, 0) << H1
+        | inv0 << INV0 | inv1 << INV1
+        | chamber << CHAMBER | length << LENGTH
+        | damage << DAMAGE | turn << TURN | cuffed << CUFFED
+    )
+
+def unpack(state: int) -> tuple[int, int, int, int, int, int, int, int, int]:
+    return (
+        state >> H0 & HEALTH_MASK, state >> H1 & HEALTH_MASK,
+        state >> INV0 & INV_MASK, state >> INV1 & INV_MASK,
+        state >> CHAMBER & CHAMBER_MASK, state >> LENGTH & LENGTH_MASK,
+        state >> DAMAGE & DAMAGE_MASK, state >> TURN & 1, state >> CUFFED & 1,
+    )
+
+def from_engine(engine: BuckshotEngine) -> int:
+    """Capture a running 1v1 BuckshotEngine as a packed state"""
+    if not engine.ready:
+        raise ValueError("The engine has no players to capture yet")
+    if engine.ITEM_CAPS != Inventory.VALID_ITEMS or engine.CAPACITY != (Shotgun.MIN_CAPACITY, Shotgun.MAX_CAPACITY):
+        raise ValueError("The kernel only models the default item caps and shotgun capacity")
+
+    p0, p1 = engine.PLAYERS
+    shotgun = engine.SHOTGUN
+    chamber = 0
+    for i, shell in enumerate(shotgun.chamber):
+        if shell:
+            chamber |= 1 << i
+
+    inv0, inv1 = (
+        sum(p.inventory.items.get(item, 0) << (slot * ITEM_BITS) for slot, item in enumerate(Inventory.VALID_ITEMS))
+        for p in (p0, p1)
+    )
+    return pack(
+        p0.health, p1.health, inv0, inv1,
+        chamber, len(shotgun.chamber), shotgun.damage, engine.TURN,
+    )
+
+def new_game(max_health: int = BuckshotEngine.MAX_HEALTH) -> int:
+    return pack(max_health, max_health)
+
+def item_count(inv: int, slot: int) -> int:
+    return inv >> (slot * ITEM_BITS) & ITEM_MASK
+
+# CHOICES[inv] -> (n, bits, increments): Inventory.add draws an item slot with
+# choice(available), i.e. getrandbits(bits) until below n, and increments[r]
+# is added to the packed inventory; None once the inventory takes no more
+CHOICES: dict[int, tuple[int, int, tuple[int, ...]] | None] = {
+    inv: (
+        len(available), len(available).bit_length(),
+        tuple(1 << (slot * ITEM_BITS) for slot in available),
+    ) if available and TOTAL[inv] < Inventory.MAX_CAPACITY else None
+    for inv, available in AVAILABLE.items()
+}
+
+# DRAWS[capacity] -> (i, n, bits) of each shuffle step: j = randbelow(n = i + 1)
+# for i = capacity-1..1, drawn as getrandbits(bits) until below n
+DRAWS: dict[int, tuple[tuple[int, int, int], ...]] = {
+    capacity: tuple((i, i + 1, (i + 1).bit_length()) for i in range(capacity - 1, 0, -1))
+    for capacity in range(Shotgun.MIN_CAPACITY, Shotgun.MAX_CAPACITY + 1)
+}
+# LIVES[capacity] -> (n, bits) of the randint(1, capacity // 2) draw
+LIVES: dict[int, tuple[int, int]] = {
+    capacity: (capacity // 2, (capacity // 2).bit_length()) for capacity in DRAWS
+}
+CAPACITY_SPAN: int = Shotgun.MAX_CAPACITY - Shotgun.MIN_CAPACITY + 1
+KEEP_MASK: int = H0_FIELD | H1_FIELD | DAMAGE_FIELD | TURN_FLAG | 1 << CUFFED
+
+def add_items(inv: int, n_items: int, rng: RNG = rand) -> int:
+    """Inventory.add on a packed inventory"""
+    getrandbits = rng.getrandbits
+    for _ in range(n_items):
+        choice = CHOICES[inv]
+        if choice is None:
+            break
+
+        n, bits, increments = choice
+        r = getrandbits(bits)
+        while r >= n:
+            r = getrandbits(bits)
+        inv += increments[r]
+    return inv
+
+def reload(
+    state: int,
+    n_items: int = BuckshotEngine.N_ITEMS,
+    shells: RNG = rand,
+    items: RNG = rand,
+    _min: int = Shotgun.MIN_CAPACITY,
+    _span: int = CAPACITY_SPAN,
+    _lives: dict[int, tuple[int, int]] = LIVES,
+    _draws: dict[int, tuple[tuple[int, int, int], ...]] = DRAWS,
+    _add: Callable[[int, int, RNG], int] = add_items,
+    _keep: int = KEEP_MASK,
+) -> int:
+    """
+    BuckshotEngine.reset(): load new shells, then deal items to each seat.
+    `shells` and `items` stand in for BuckshotEngine.SHELL_RNG and ITEM_RNG.
+
+    This pins how CPython's `random` draws: randint, shuffle and choice all
+    reduce to Random._randbelow(n), which redraws getrandbits(n.bit_length())
+    until the value is below n, and shuffle is a Fisher-Yates pass drawing
+    j = _randbelow(i + 1) for i = len-1..1. Only the public getrandbits is
+    called, in the same order as Shotgun.reload and Inventory.add, so seeded
+    games stay in step while the shuffle swaps bits of the chamber mask in
+    place. Going through randint/shuffle/choice costs several times more per
+    reload. If a Python release changes those internals, kernel games drift
+    from engine games and benchmarks/kernel_diff.py fails on the first one.
+    """
+    getrandbits = shells.getrandbits
+
+    # capacity = randint(MIN_CAPACITY, MAX_CAPACITY)
+    bits = _span.bit_length()
+    r = getrandbits(bits)
+    while r >= _span:
+        r = getrandbits(bits)
+    capacity = _min + r
+    if capacity > CHAMBER_BITS:
+        raise ValueError(f"Chamber of {capacity} shells does not fit the kernel layout")
+
+    # lives = randint(1, capacity // 2), loaded into the low bits
+    n, bits = _lives[capacity]
+    r = getrandbits(bits)
+    while r >= n:
+        r = getrandbits(bits)
+    chamber = (2 << r) - 1
+
+    # shuffle(shells): swap shells i and j when they differ
+    for i, n, bits in _draws[capacity]:
+        j = getrandbits(bits)
+        while j >= n:
+            j = getrandbits(bits)
+        if (chamber >> i ^ chamber >> j) & 1:
+            chamber ^= 1 << i | 1 << j
+
+    inv0 = _add(state >> INV0 & INV_MASK, n_items, items)
+    inv1 = _add(state >> INV1 & INV_MASK, n_items, items)
+    return state & _keep | inv0 << INV0 | inv1 << INV1 | chamber << CHAMBER | capacity << LENGTH
+
+def shoot(board: int) -> int:
+    """
+    UseGunAction on the board bits: eject the last shell, apply damage,
+    reset the damage multiplier and pass the turn unless the shot kills.
+    """
+    length = board >> LENGTH & LENGTH_MASK
+    if length:
+        length -= 1
+        board -= 1 << LENGTH
+        shell = 1 << (CHAMBER + length)
+        if board & shell:
+            board ^= shell
+            target = H0 if board & TURN_FLAG else H1
+            health = (board >> target & HEALTH_MASK) - (board >> DAMAGE & DAMAGE_MASK)
+            if health <= 0:
+                return (board & ~(HEALTH_MASK << target | DAMAGE_FIELD)) | 1 << DAMAGE
+            board = (board & ~(HEALTH_MASK << target)) | health << target
+
+    return (board & ~DAMAGE_FIELD | 1 << DAMAGE) ^ TURN_FLAG
+
+class _ShotTable(dict[int, int]):
+    def __missing__(self, board: int) -> int:
+        self[board] = after = shoot(board)
+        return after
+
+# SHOT[board] -> board after a shot, filled on first use
+SHOT: dict[int, int] = _ShotTable()
+
+def step(
+    state: int,
+    opcode: int,
+    _gun: int = GUN,
+    _turn: int = TURN_FLAG,
+    _board: int = BOARD_MASK,
+    _shot: dict[int, int] = SHOT,
+) -> int:
+    """
+    Resolve one action for the seat holding TURN and end the turn.
+    Items have no effect yet, mirroring the stub actions in action.py.
+    Constants are bound as defaults to keep global lookups off the hot path.
+    """
+    if opcode != _gun:
+        return state ^ _turn
+
+    board = state & _board
+    return state - board + _shot[board]
+
+def fire(board: int) -> int:
+    """shoot() for advance(): the board after the shot, complemented when the turn ends in a reload"""
+    after = shoot(board)
+    if after & LENGTH_FIELD or not (after & H0_FIELD and after & H1_FIELD):
+        return after
+    return ~after
+
+# FIRED[board] -> fire(board), filled on first use; a plain dict for the fastest lookup
+FIRED: dict[int, int] = {}
+
+def advance(
+    state: int,
+    opcode: int,
+    n_items: int = BuckshotEngine.N_ITEMS,
+    shells: RNG = rand,
+    items: RNG = rand,
+    _gun: int = GUN,
+    _turn: int = TURN_FLAG,
+    _board: int = BOARD_MASK,
+    _fired: dict[int, int] = FIRED,
+) -> int:
+    """
+    One full turn, the kernel's BuckshotEngine.execute: step, then reload
+    if the shot emptied the chamber and both seats are still alive.
+    """
+    if opcode != _gun:
+        return state ^ _turn
+
+    board = state & _board
+    try:
+        after = _fired[board]
+    except KeyError:
+        after = _fired[board] = fire(board)
+
+    if after >= 0:
+        return state - board + after
+    return reload(state - board + ~after, n_items, shells, items)
+
+def replay(
+    state: int,
+    opcodes: Iterable[int],
+    n_items: int = BuckshotEngine.N_ITEMS,
+    shells: RNG = rand,
+    items: RNG = rand,
+    _gun: int = GUN,
+    _turn: int = TURN_FLAG,
+    _board: int = BOARD_MASK,
+    _fired: dict[int, int] = FIRED,
+) -> int:
+    """
+    advance() over a recorded action sequence in one call, the batched entry
+    point for bulk simulation. The turn is inlined and works on the board
+    bits alone, a single-digit int; the full state is only touched on reload.
+    """
+    board = state & _board
+    for opcode in opcodes:
+        if opcode != _gun:
+            board ^= _turn
+            continue
+
+        try:
+            after = _fired[board]
+        except KeyError:
+            after = _fired[board] = fire(board)
+
+        if after >= 0:
+            board = after
+        else:
+            state = reload(state - (state & _board) + ~after, n_items, shells, items)
+            board = state & _board
+    return state - (state & _board) + board
+
+def over(state: int) -> bool:
+    return not (state & H0_FIELD and state & H1_FIELD)
+
+def empty(state: int) -> bool:
+    return not state & LENGTH_FIELD
+
+def winner(state: int) -> int:
+    """Seat index of the last player standing, -1 while both are alive"""
+    if not state & H0_FIELD:
+        return 1
+    if not state & H1_FIELD:
+        return 0
+    return -1
+
+def random_policy(state: int, rng: rand.Random) -> int:
+    """playout.random_policy on a packed state, same draw for the same holdings"""
+    inv = state >> (INV1 if state & TURN_FLAG else INV0) & INV_MASK
+    held = [op for slot, op in enumerate(ITEM_OPCODES) if item_count(inv, slot)]
+    held.append(GUN)
+    return rng.choice(held)
+
+def play(
+    seed: int,
+    game: int = 0,
+    max_health: int = BuckshotEngine.MAX_HEALTH,
+    n_items: int = BuckshotEngine.N_ITEMS,
+    policy: Policy = random_policy,
+    max_turns: int = 1000,
+) -> tuple[int, int]:
+    """
+    Play game `game` of the run seeded with `seed` to the end, on the same
+    streams as playout.play; return the final state and turn count
+    """
+    s = streams(seed, game)
+    state = reload(new_game(max_health), n_items, s.shells, s.items)
+
+    for turn in range(max_turns):
+        state = advance(state, policy(state, s.policy), n_items, s.shells, s.items)
+        if over(state):
+            return state, turn + 1
+
+    return state, max_turns
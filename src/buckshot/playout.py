@@ -0,0 +1,70 @@
+"""
+Seeded self-play: per-game RNG streams, a random policy and the play loop.
+Needs nothing beyond the standard library, so simulation tools built on it
+work without the `sim` extra.
+
+Game `game` of a run seeded with `seed` draws shells, items and policy
+choices from three separate streams, each seeded from (seed, game). A rule
+change that deals one more item or loads one more shell then only shifts
+its own stream, so two variants still face the same shells and make the
+same choices wherever their rules agree (common random numbers).
+"""
+from __future__ import annotations
+import random as rand
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from buckshot.engine import BuckshotEngine
+
+Policy = Callable[[BuckshotEngine, rand.Random], str]
+
+@dataclass(frozen=True)
+class Streams:
+    shells: rand.Random
+    items: rand.Random
+    policy: rand.Random
+
+def streams(seed: int, game: int) -> Streams:
+    """Independent, reproducible RNG streams for one game"""
+    return Streams(*(rand.Random(f"{seed}/{game}/{name}") for name in ("shells", "items", "policy")))
+
+def random_policy(engine: BuckshotEngine, rng: rand.Random) -> str:
+    """Pick uniformly between the gun and every item the actor holds"""
+    inventory = engine.ACTOR.inventory
+    held = [item for item in inventory.items if inventory.has_item(item)]
+    return rng.choice(held + ["gun"])
+
+def deal(engine: BuckshotEngine, seed: int, game: int) -> Streams:
+    """Point the engine at the game's streams and start the game, signing in on first use"""
+    s = streams(seed, game)
+    engine.SHELL_RNG, engine.ITEM_RNG = s.shells, s.items
+    if engine.ready:
+        engine.reset(hard=True)
+    else:
+        engine.sign("Player")
+    return s
+
+def turns(
+    engine: BuckshotEngine,
+    rng: rand.Random,
+    policy: Policy = random_policy,
+    max_turns: int = 1000,
+) -> Iterator[str]:
+    """Play the policy's items until the game is over, yield each once played"""
+    for _ in range(max_turns):
+        if engine.over:
+            return
+        item = policy(engine, rng)
+        engine.execute(item)
+        yield item
+
+def play(
+    engine: BuckshotEngine,
+    seed: int,
+    game: int,
+    policy: Policy = random_policy,
+    max_turns: int = 1000,
+) -> Iterator[str]:
+    """Deal game `game` of the run seeded with `seed` and play it through"""
+    s = deal(engine, seed, game)
+    yield from turns(engine, s.policy, policy, max_turns)
@@ -0,0 +1,229 @@
+from __future__ import annotations
+import asyncio
+import logging
+import struct
+from collections.abc import AsyncGenerator
+from typing import override
+
+from buckshot.engine import BuckshotEngine
+from buckshot.entity import Inventory
+
+log = logging.getLogger(__name__)
+
+class DeltaEncoder:
+    """
+    Turn engine states into compact binary frames.
+
+    The board is flattened into a fixed tuple of small integers:
+    turn, stage, shotgun (damage, bullets_left, lives, blanks), then
+    health + item counts for each player. Frames are length-prefixed
+    (`<u16 size><u8 kind><payload>`):
+    - KEYFRAME: `<u8 n_fields>` followed by every field as i8
+    - DELTA: `<u32 mask>` followed by each changed field as i8
+    """
+    KEYFRAME: int = 0x01
+    DELTA: int = 0x02
+    MAX_FIELDS: int = 32
+
+    HEADER = struct.Struct("<HB")
+    MASK = struct.Struct("<I")
+
+    def __init__(self) -> None:
+        self.fields: tuple[int, ...] = ()
+        self._keyframe: bytes | None = None
+
+    @staticmethod
+    def flatten(state: BuckshotEngine.State) -> tuple[int, ...]:
+        shotgun = state.shotgun
+        fields = [
+            state.turn,
+            int(state.stage),
+            shotgun.damage,
+            shotgun.bullets_left,
+            shotgun.lives,
+            shotgun.blanks,
+        ]
+        for p in state.players:
+            fields.append(p.health)
+            fields.extend(p.inventory.get(item, 0) for item in Inventory.VALID_ITEMS)
+        return tuple(fields)
+
+    @classmethod
+    def frame(cls, kind: int, payload: bytes) -> bytes:
+        return cls.HEADER.pack(len(payload) + 1, kind) + payload
+
+    @classmethod
+    def pack_keyframe(cls, fields: tuple[int, ...]) -> bytes:
+        n = len(fields)
+        return cls.frame(cls.KEYFRAME, struct.pack(f"<B{n}b", n, *fields))
+
+    def keyframe(self) -> bytes:
+        """Full board frame, cached until the board changes"""
+        if self._keyframe is None:
+            self._keyframe = self.pack_keyframe(self.fields)
+        return self._keyframe
+
+    def encode(self, state: BuckshotEngine.State) -> bytes | None:
+        """
+        Return a delta against the previous state, None if nothing changed.
+        Raises ValueError/struct.error when the board does not fit the
+        format; the encoder is left on the previous state in that case.
+        """
+        fields = self.flatten(state)
+        if len(fields) > self.MAX_FIELDS:
+            raise ValueError(f"Too many fields to delta-encode: {len(fields)}")
+
+        prev = self.fields
+        if len(prev) != len(fields):
+            frame = self.pack_keyframe(fields)
+            self.fields, self._keyframe = fields, frame
+            return frame
+
+        mask = 0
+        changed: list[int] = []
+        for i, (old, new) in enumerate(zip(prev, fields)):
+            if old != new:
+                mask |= 1 << i
+                changed.append(new)
+
+        if not mask:
+            return None
+
+        frame = self.frame(
+            self.DELTA,
+            self.MASK.pack(mask) + struct.pack(f"<{len(changed)}b", *changed)
+        )
+        self.fields, self._keyframe = fields, None
+        return frame
+
+class DeltaDecoder:
+    """Rebuild the flattened board on the spectator side."""
+    def __init__(self) -> None:
+        self.fields: list[int] = []
+
+    @property
+    def synced(self) -> bool:
+        return bool(self.fields)
+
+    def apply(self, kind: int, payload: bytes) -> tuple[int, ...] | None:
+        """Apply one frame; deltas received before the first keyframe are dropped"""
+        if kind == DeltaEncoder.KEYFRAME:
+            n = payload[0]
+            self.fields = list(struct.unpack_from(f"<{n}b", payload, 1))
+            return tuple(self.fields)
+
+        if kind != DeltaEncoder.DELTA or not self.synced:
+            return None
+
+        (mask,) = DeltaEncoder.MASK.unpack_from(payload)
+        values = iter(struct.unpack_from(
+            f"<{mask.bit_count()}b", payload, DeltaEncoder.MASK.size
+        ))
+        for i in range(len(self.fields)):
+            if mask >> i & 1:
+                self.fields[i] = next(values)
+        return tuple(self.fields)
+
+class SpectatorServer(BuckshotEngine.Observer):
+    """
+    Fan engine updates out to read-only spectators over a unix socket.
+
+    Each update is encoded once and the same bytes are handed to every
+    client, so the per-spectator cost is a buffer append. A client whose
+    write buffer is above `high_water` is skipped and marked stale; it is
+    resynced with a keyframe once it drains. Every `keyframe_every`-th
+    frame is a keyframe for all clients, and new clients get one on join.
+
+    Must run on the same event loop thread that drives the engine.
+    """
+    def __init__(
+        self,
+        engine: BuckshotEngine,
+        path: str,
+        keyframe_every: int = 64,
+        high_water: int = 64 * 1024,
+    ) -> None:
+        self.path = path
+        self.keyframe_every = keyframe_every
+        self.high_water = high_water
+        self._encoder = DeltaEncoder()
+        self._clients: dict[asyncio.StreamWriter, bool] = {} # writer -> needs keyframe
+        self._server: asyncio.Server | None = None
+        self._n_frames = 0
+        engine.attach(self)
+
+    @property
+    def n_clients(self) -> int:
+        return len(self._clients)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(self._on_connect, path=self.path)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._clients):
+            writer.close()
+        self._clients.clear()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients[writer] = True
+        if self._encoder.fields:
+            writer.write(self._encoder.keyframe())
+            self._clients[writer] = False
+
+        try:
+            await reader.read() # spectators never talk back, wait for EOF
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    @override
+    def on_engine_update(self, state: BuckshotEngine.State) -> None:
+        # A spectator must never break the game: drop frames that do not encode
+        try:
+            frame = self._encoder.encode(state)
+        except (ValueError, struct.error) as exc:
+            log.warning("Dropped spectator frame: %s", exc)
+            return
+
+        if frame is None:
+            return
+
+        self._n_frames += 1
+        if self._n_frames % self.keyframe_every == 0:
+            frame = self._encoder.keyframe()
+
+        for writer, stale in self._clients.items():
+            if writer.transport.get_write_buffer_size() > self.high_water:
+                self._clients[writer] = True
+                continue
+
+            if stale:
+                writer.write(self._encoder.keyframe())
+                self._clients[writer] = False
+            else:
+                writer.write(frame)
+
+async def spectate(path: str) -> AsyncGenerator[tuple[int, ...]]:
+    """Connect to a SpectatorServer and yield the flattened board on every change"""
+    reader, writer = await asyncio.open_unix_connection(path)
+    decoder = DeltaDecoder()
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(DeltaEncoder.HEADER.size)
+            except asyncio.IncompleteReadError:
+                return
+            size, kind = DeltaEncoder.HEADER.unpack(header)
+            payload = await reader.readexactly(size - 1)
+            fields = decoder.apply(kind, payload)
+            if fields is not None:
+                yield fields
+    finally:
+        writer.close()
@@ -7,9 +7,16 @@ from buckshot.entity import *
 if TYPE_CHECKING:
     from buckshot.engine import BuckshotEngine
 
+# Transition events returned by FSM.update, used as indexes into TRANSITIONS
+STAY, NEXT, RESOLVE, END_TURN, GAME_OVER = range(5)
+
 class FSM(ABC):
+    """
+    States hold no per-turn data and are used as module-level singletons;
+    anything a state needs to carry over lives on the engine.
+    """
     @abstractmethod
-    def update(self, engine: BuckshotEngine, trigger: BuckshotEngine.Trigger | None) -> FSM:
+    def update(self, engine: BuckshotEngine, opcode: int) -> int:
         pass
 
     def on_enter(self, engine: BuckshotEngine) -> None:
@@ -19,12 +26,12 @@ class FSM(ABC):
         pass
 
 class InitState(FSM):
-    def update(self, engine: BuckshotEngine, trigger: BuckshotEngine.Trigger | None) -> FSM:
+    def update(self, engine: BuckshotEngine, opcode: int) -> int:
         if not engine.ready:
-            return self
+            return STAY
 
-        engine.SHOTGUN = Shotgun()
-        return AwaitActionState()
+        engine.SHOTGUN = engine.new_shotgun()
+        return NEXT
 
     def on_exit(self, engine: BuckshotEngine) -> None:
         engine.notify("Good, you sign the contract. NOW, let's us begin!", type="done")
@@ -34,38 +41,51 @@ class AwaitActionState(FSM):
         if engine.SHOTGUN.is_empty:
             engine.reset()
 
-    def update(self, engine: BuckshotEngine, trigger: BuckshotEngine.Trigger | None) -> FSM:
-        if trigger is None:
-            return self
+    def update(self, engine: BuckshotEngine, opcode: int) -> int:
+        if opcode == NO_OPCODE:
+            return STAY
 
-        if trigger.item not in VALID_ACTIONS:
+        if opcode == INVALID_OPCODE:
             engine.notify("Invalid item use.", type="error")
-            return self
+            return STAY
 
-        action = VALID_ACTIONS[trigger.item](engine)
-        return ResolveActionState(action)
+        engine.action = engine.actions[opcode]
+        return RESOLVE
 
 class ResolveActionState(FSM):
     class EndTurnState(FSM):
-        def update(self, engine: BuckshotEngine, trigger: BuckshotEngine.Trigger | None) -> FSM:
+        def update(self, engine: BuckshotEngine, opcode: int) -> int:
             engine.next_player()
-            return AwaitActionState()
+            return NEXT
 
     class GameOverState(FSM):
-        def update(self, engine: BuckshotEngine, trigger: BuckshotEngine.Trigger | None) -> FSM:
-            return self
-
-    def __init__(self, action: Action) -> None:
-        self.action = action
+        def update(self, engine: BuckshotEngine, opcode: int) -> int:
+            return STAY
 
-    def update(self, engine: BuckshotEngine, trigger: BuckshotEngine.Trigger | None) -> FSM:
-        result = self.action.execute()
+    def update(self, engine: BuckshotEngine, opcode: int) -> int:
+        result = engine.action.execute()
+        engine.notify(result.response, type="done")
 
         if result.game_over:
-            return self.GameOverState()
+            return GAME_OVER
 
         if result.end_turn:
-            return self.EndTurnState()
-
-        return AwaitActionState()
-
+            return END_TURN
+
+        return NEXT
+
+INIT = InitState()
+AWAIT_ACTION = AwaitActionState()
+RESOLVE_ACTION = ResolveActionState()
+END_TURN_STATE = ResolveActionState.EndTurnState()
+GAME_OVER_STATE = ResolveActionState.GameOverState()
+
+# Precompiled transition table: TRANSITIONS[state][event] -> next state;
+# events a state never returns are simply missing from its row
+TRANSITIONS: dict[FSM, dict[int, FSM]] = {
+    INIT:            {NEXT: AWAIT_ACTION},
+    AWAIT_ACTION:    {RESOLVE: RESOLVE_ACTION},
+    RESOLVE_ACTION:  {NEXT: AWAIT_ACTION, END_TURN: END_TURN_STATE, GAME_OVER: GAME_OVER_STATE},
+    END_TURN_STATE:  {NEXT: AWAIT_ACTION},
+    GAME_OVER_STATE: {},
+}
@@ -0,0 +1,175 @@
+"""
+Adaptive-precision win-rate estimation over rule variants.
+
+Each variant plays BuckshotEngine games in growing batches and stops once
+the Wilson interval of the player's win rate is narrower than the target
+width. Game i plays on the same playout streams of (seed, i) for every
+variant (common random numbers), so variants are compared on the same
+shell, item and policy draws as far as the rules allow, and paired
+differences against the first variant get much tighter than independent
+runs would. Variants are configured per engine, never by patching the
+entity classes, so other engines in the process are unaffected.
+"""
+from __future__ import annotations
+import argparse
+import itertools
+import math
+from dataclasses import dataclass, field
+
+from buckshot import playout
+from buckshot.engine import BuckshotEngine
+from buckshot.entity import Inventory, Shotgun
+from buckshot.playout import Policy, random_policy
+
+Z_95: float = 1.959964
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    max_health: int = BuckshotEngine.MAX_HEALTH
+    n_items: int = BuckshotEngine.N_ITEMS
+    caps: dict[str, int] = field(default_factory=lambda: dict(Inventory.VALID_ITEMS))
+    capacity: tuple[int, int] = (Shotgun.MIN_CAPACITY, Shotgun.MAX_CAPACITY)
+
+    def configure(self, engine: BuckshotEngine) -> None:
+        """Apply the variant's rules to one engine"""
+        engine.MAX_HEALTH, engine.N_ITEMS = self.max_health, self.n_items
+        engine.ITEM_CAPS, engine.CAPACITY = self.caps, self.capacity
+
+@dataclass
+class Estimate:
+    variant: Variant
+    wins: bytearray = field(default_factory=bytearray) # wins[i]: player won game i
+    engine: BuckshotEngine = field(default_factory=BuckshotEngine, repr=False)
+
+    @property
+    def n(self) -> int:
+        return len(self.wins)
+
+    @property
+    def rate(self) -> float:
+        return sum(self.wins) / self.n if self.n else 0.0
+
+    def half_width(self, z: float = Z_95) -> float:
+        """Half width of the Wilson score interval"""
+        if not self.n:
+            return math.inf
+        n, p = self.n, self.rate
+        return z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+
+    def run(self, n_games: int, seed: int, policy: Policy, max_turns: int) -> None:
+        engine = self.engine
+        self.variant.configure(engine)
+        for game in range(self.n, self.n + n_games):
+            for _ in playout.play(engine, seed, game, policy, max_turns):
+                pass
+            self.wins.append(engine.winner is engine.PLAYERS[0])
+
+def paired_difference(a: Estimate, b: Estimate, z: float = Z_95) -> tuple[float, float]:
+    """Win-rate difference a - b and its half width over the games both played"""
+    n = min(a.n, b.n)
+    if n < 2:
+        return 0.0, math.inf
+
+    diffs = [x - y for x, y in zip(a.wins[:n], b.wins[:n])]
+    mean = sum(diffs) / n
+    var = sum((d - mean) ** 2 for d in diffs) / (n - 1)
+    return mean, z * math.sqrt(var / n)
+
+def estimate(
+    variants: list[Variant],
+    width: float = 0.02,
+    seed: int = 0,
+    batch: int = 64,
+    max_games: int = 200_000,
+    policy: Policy = random_policy,
+    max_turns: int = 1000,
+    z: float = Z_95,
+) -> list[Estimate]:
+    """
+    Run every variant until its interval is narrower than `width` or it
+    hits `max_games`. Batches double each round but never overshoot the
+    game count projected from the current interval (half width shrinks
+    as 1/sqrt(n)). All variants play game i on the same streams.
+    """
+    estimates = [Estimate(v) for v in variants]
+    active = list(estimates)
+    min_batch = batch
+    while active:
+        for est in active:
+            n_games = batch
+            if est.n:
+                projected = math.ceil(est.n * (2 * est.half_width(z) / width) ** 2)
+                n_games = max(min(batch, projected - est.n), min_batch // 4, 1)
+            est.run(min(n_games, max_games - est.n), seed, policy, max_turns)
+        active = [
+            est for est in active
+            if 2 * est.half_width(z) > width and est.n < max_games
+        ]
+        batch *= 2
+    return estimates
+
+def _capacity(value: str) -> tuple[int, int]:
+    try:
+        low, high = map(int, value.split("-"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected LOW-HIGH, got {value!r}") from None
+    # a reload loads randint(1, capacity // 2) lives, so it needs 2 shells
+    if low < 2 or low > high:
+        raise argparse.ArgumentTypeError(f"capacity range needs 2 <= low <= high, got {value!r}")
+    return low, high
+
+def _caps(value: str) -> dict[str, int]:
+    """ITEM=N[,ITEM=N...] on top of the default caps, N=0 never deals the item"""
+    caps = dict(Inventory.VALID_ITEMS)
+    for pair in value.split(","):
+        item, _, n = pair.partition("=")
+        if item not in caps or not n.isdigit():
+            raise argparse.ArgumentTypeError(
+                f"expected ITEM=N with ITEM one of {', '.join(caps)}, got {pair!r}"
+            )
+        caps[item] = int(n)
+    return caps
+
+def _describe(caps: dict[str, int]) -> str:
+    changed = [f"{item}={n}" for item, n in caps.items() if n != Inventory.VALID_ITEMS[item]]
+    return ",".join(changed) or "default"
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m buckshot.sweep")
+    parser.add_argument("--max-health", type=int, nargs="+", default=[BuckshotEngine.MAX_HEALTH])
+    parser.add_argument("--n-items", type=int, nargs="+", default=[BuckshotEngine.N_ITEMS])
+    parser.add_argument(
+        "--capacity", type=_capacity, nargs="+",
+        default=[(Shotgun.MIN_CAPACITY, Shotgun.MAX_CAPACITY)],
+        help="reload capacity ranges such as 3-8",
+    )
+    parser.add_argument(
+        "--caps", type=_caps, nargs="+", default=[dict(Inventory.VALID_ITEMS)],
+        help="item cap overrides such as handsaw=0,beer=3",
+    )
+    parser.add_argument("--width", type=float, default=0.02, help="target 95%% interval width")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--max-games", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    variants = [
+        Variant(
+            f"health={h} items={n} capacity={c[0]}-{c[1]} caps={_describe(caps)}",
+            max_health=h, n_items=n, caps=caps, capacity=c,
+        )
+        for h, n, c, caps in itertools.product(args.max_health, args.n_items, args.capacity, args.caps)
+    ]
+    estimates = estimate(variants, args.width, args.seed, args.batch, args.max_games)
+
+    base = estimates[0]
+    for est in estimates:
+        diff, half = paired_difference(est, base)
+        print(
+            f"{est.variant.name:<52} games={est.n:<7} win={est.rate:.4f} "
+            f"±{est.half_width():.4f}  vs base {diff:+.4f} ±{half:.4f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
 from __future__ import annotations
+from abc import abstractmethod
 from typing import Literal, Self, override
 
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, HorizontalGroup
 from textual.message import Message
-from textual.reactive import reactive
 from textual.suggester import Suggester
 from textual.widget import Widget
 from textual.widgets import (
@@ -15,6 +15,7 @@ from textual.widgets import (
     Static,
 )
 from buckshot.engine import BuckshotEngine
+from buckshot.entity import Inventory
 
 # --- Buckshot Game Container ---
 class GameContainer(Container):
@@ -102,8 +103,67 @@ class Logs(RichLog, BuckshotEngine.Observer):
     def on_engine_update(self, state: BuckshotEngine.State):
         self.write(f"Player executed a command: {state.response}", type="success")
 
-class StatsReport(Widget, BuckshotEngine.Observer):
+class _Bar(dict[int, str]):
+    """bar[n] -> n icons joined by sep, built on first use so no maximum is baked in"""
+    def __init__(self, icon: str, sep: str = "") -> None:
+        super().__init__()
+        self.icon, self.sep = icon, sep
+
+    def __missing__(self, n: int) -> str:
+        self[n] = text = self.sep.join([self.icon] * n)
+        return text
+
+class ThrottledObserver(Widget, BuckshotEngine.Observer):
+    """
+    Coalesce engine updates so the widget renders at most once per frame:
+    the first update of a burst is drawn right away, later ones within the
+    frame collapse into one trailing draw of the latest state.
+    """
+    FPS: int = 60
+
+    def __init__(self, engine: BuckshotEngine, **kwargs) -> None:
+        super().__init__(**kwargs)
+        engine.attach(self)
+        self._pending: BuckshotEngine.State | None = None
+        self._throttled = False
+
+    @override
+    def on_engine_update(self, state: BuckshotEngine.State):
+        if self._throttled:
+            self._pending = state
+            return
+
+        self._draw(state)
+        self._throttled = True
+        self.set_timer(1 / self.FPS, self._flush)
+
+    def _flush(self) -> None:
+        """End of a frame: draw what arrived during it and hold the next one, else stop throttling"""
+        state, self._pending = self._pending, None
+        if state is None:
+            self._throttled = False
+            return
+
+        self._draw(state)
+        self.set_timer(1 / self.FPS, self._flush)
+
+    def _draw(self, state: BuckshotEngine.State) -> None:
+        self.display = True
+        self.render_state(state)
+
+    @staticmethod
+    def _update(static: Static, text: str) -> None:
+        """Skip Static.update (and the repaint it queues) when text is unchanged"""
+        if static.content != text:
+            static.update(text)
+
+    @abstractmethod
+    def render_state(self, state: BuckshotEngine.State) -> None:
+        pass
+
+class StatsReport(ThrottledObserver):
     BORDER_TITLE = " 󰷨 Board's Status "
+    BULLETS: dict[int, str] = _Bar("󰲅", " ")
     DEFAULT_CSS = """
     StatsReport HorizontalGroup {
         height: 1;
@@ -112,44 +172,34 @@ class StatsReport(Widget, BuckshotEngine.Observer):
     }
     """
 
-    chamber: reactive[str] = reactive("?")
-    turn: reactive[str] = reactive("?")
-    items: reactive[str] = reactive("?")
-    stage: reactive[str] = reactive("?")
-
     def __init__(self, engine: BuckshotEngine) -> None:
-        super().__init__(classes="sub-panel")
-        engine.attach(self)
+        super().__init__(engine, classes="sub-panel")
         self.display = False
+        self.chamber = Static("?", id="status-chamber", classes="right-align")
+        self.turn = Static("?", id="status-turn", classes="right-align")
+        self.items = Static("?", id="status-items", classes="right-align")
+        self.stage = Static("?", id="status-stage", classes="right-align")
 
     def compose(self) -> ComposeResult:
-        for label, attr in [
-            ("Bullets Left:", "chamber"),
-            ("Current Turn:", "turn"),
-            ("Items Add:", "items"),
-            ("Stage:", "stage"),
+        for label, static in [
+            ("Bullets Left:", self.chamber),
+            ("Current Turn:", self.turn),
+            ("Items Add:", self.items),
+            ("Stage:", self.stage),
         ]:
             with HorizontalGroup():
                 yield Label(label)
-                yield Static(getattr(self, attr), id=f"status-{attr}", classes="right-align")
-
-    def on_mount(self) -> None:
-        def w_func(attr: str):
-            return lambda v: self.query_one(f"#status-{attr}", Static).update(v)
-
-        for attr in ["chamber", "turn", "items", "stage"]:
-            self.watch(self, attr, w_func(attr))
+                yield static
 
     @override
-    def on_engine_update(self, state: BuckshotEngine.State):
-        self.display = not False
-        self.chamber = " ".join(["󰲅"] * state.shotgun.bullets_left)
-        self.turn = state.players[state.turn].name.upper()
-        self.items = str(state.n_items)
-        self.stage = state.stage
-
-class PlayerInfo(Widget, BuckshotEngine.Observer):
-    BORDER_TITLE = "  Player's Info "
+    def render_state(self, state: BuckshotEngine.State):
+        self._update(self.chamber, self.BULLETS[state.shotgun.bullets_left])
+        self._update(self.turn, state.players[state.turn].name.upper())
+        self._update(self.items, str(state.n_items))
+        self._update(self.stage, state.stage)
+
+class PlayerInfo(ThrottledObserver):
+    BORDER_TITLE = "  Player's Info "
     ICONS = {
         "magnifier": "󰍉", 
         "beer": "󱄖", 
@@ -175,35 +225,40 @@ class PlayerInfo(Widget, BuckshotEngine.Observer):
     }
     """
 
-    pname: reactive[str] = reactive("")
-    health: reactive[str] = reactive("")
-    inventory: reactive[str] = reactive("")
+    HEALTH: dict[int, str] = _Bar("󱐋")
+    # ITEM_TEXT[item][count] -> "<icon> <count>"
+    ITEM_TEXT = {
+        item: tuple(f"{icon} {n}" for n in range(Inventory.MAX_CAPACITY + 1))
+        for item, icon in ICONS.items()
+    }
 
     def __init__(self, engine: BuckshotEngine) -> None:
-        super().__init__(classes="sub-panel")
-        engine.attach(self)
+        super().__init__(engine, classes="sub-panel")
         self.display = False
+        self.pname = Label(":", id="player-pname")
+        self.health = Static("", id="player-health")
+        self.inventory = Static("", id="player-inventory")
+        self._items: tuple[int, ...] = ()
 
     def compose(self) -> ComposeResult:
         with HorizontalGroup():
-            yield Label(f"{self.pname}:", id="player-pname")
-            yield Static(self.health, id="player-health")
-        yield Static(self.inventory, id="player-inventory")
-
-    def on_mount(self):
-        def w_func(attr: str):
-            return lambda v: self.query_one(f"#player-{attr}", Static).update(v)
-
-        for attr in ["pname", "health", "inventory"]:
-            self.watch(self, attr, w_func(attr))
+            yield self.pname
+            yield self.health
+        yield self.inventory
 
     @override
-    def on_engine_update(self, state: BuckshotEngine.State):
-        self.display = not False
+    def render_state(self, state: BuckshotEngine.State):
         p_state = state.players[0]
-        self.pname = p_state.name.upper() + ":"
-        self.health = " ".join(["󱐋" * p_state.health])
-        self.inventory = " | ".join(f"{self.ICONS[k]} {v}" for k, v in p_state.inventory.items())
+        health = max(p_state.health, 0)
+        self._update(self.pname, p_state.name.upper() + ":")
+        self._update(self.health, self.HEALTH[health])
+
+        items = tuple(p_state.inventory.values())
+        if items != self._items:
+            self._items = items
+            self._update(self.inventory, " | ".join(
+                self.ITEM_TEXT[k][v] for k, v in p_state.inventory.items()
+            ))
 
 class PlayerInput(Widget):
     DEFAULT_CSS = """